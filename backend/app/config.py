@@ -13,6 +13,7 @@ class Settings(BaseSettings):
     # Application
     app_name: str = "Stock Chart Analyzer"
     debug: bool = False
+    testing: bool = False
     log_level: str = "INFO"
 
     # Server
@@ -21,6 +22,11 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./chartanalyzer.db"
+    test_database_url: str = "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_pre_ping: bool = True
+    db_pool_recycle_seconds: int = 1800  # 30 minutes
 
     # Zerodha Kite (optional)
     kite_api_key: Optional[str] = None
@@ -1,8 +1,12 @@
 """Yahoo Finance data provider implementation."""
 
 import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import yfinance as yf
 import pandas as pd
@@ -42,6 +46,18 @@ class YFinanceProvider(DataProvider):
         "1M": "1mo",
     }
 
+    # Clock used for cache timestamps; replaceable so TTL expiry can be exercised without waiting
+    _now: Callable[[], datetime] = datetime.now
+
+    # Yahoo rate-limits bursts per client with 429s, so every provider instance
+    # shares one two-thread executor (at most 2 requests in flight) and the
+    # 0.1s spacing between request starts. Queued calls wait in the executor's
+    # queue, leaving the loop's default executor free for other blocking work.
+    _upstream_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="yfinance")
+    _spacing_lock = threading.Lock()
+    _min_request_interval = 0.1  # seconds
+    _last_request_at = 0.0
+
     def __init__(self):
         """Initialize YFinance provider."""
         self._cache: dict[str, tuple[datetime, any]] = {}
@@ -51,13 +67,61 @@ class YFinanceProvider(DataProvider):
         """Get value from cache if not expired."""
         if key in self._cache:
             timestamp, value = self._cache[key]
-            if datetime.now() - timestamp < timedelta(seconds=self._cache_ttl):
+            if self._now() - timestamp < timedelta(seconds=self._cache_ttl):
                 return value
         return None
 
     def _set_cache(self, key: str, value: any) -> None:
         """Set value in cache."""
-        self._cache[key] = (datetime.now(), value)
+        self._cache[key] = (self._now(), value)
+
+    @classmethod
+    def _spaced(cls, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking yfinance call once the minimum interval since the previous one has passed."""
+        with cls._spacing_lock:
+            delay = cls._last_request_at + cls._min_request_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            cls._last_request_at = time.monotonic()
+        return func(*args, **kwargs)
+
+    async def _call_upstream(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking yfinance call on the shared upstream executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._upstream_executor, functools.partial(self._spaced, func, *args, **kwargs)
+        )
+
+    @staticmethod
+    def _load_info(formatted_symbol: str) -> dict:
+        """Fetch ticker.info for a symbol."""
+        return yf.Ticker(formatted_symbol).info
+
+    @staticmethod
+    def _load_quote_fields(formatted_symbol: str) -> Optional[tuple[dict, dict]]:
+        """Fetch fast_info fields and ticker.info for a symbol.
+
+        fast_info is lazy - attribute reads trigger the fetches - so every field
+        the quote needs is read here, inside the worker thread.
+        """
+        ticker = yf.Ticker(formatted_symbol)
+        fast_info = ticker.fast_info
+        info = ticker.info
+
+        if not fast_info:
+            return None
+
+        fields = {
+            "last_price": fast_info.last_price,
+            "previous_close": fast_info.previous_close,
+            "day_high": fast_info.day_high,
+            "day_low": fast_info.day_low,
+            "open": fast_info.open,
+            "last_volume": fast_info.last_volume,
+            "year_high": fast_info.year_high,
+            "year_low": fast_info.year_low,
+        }
+        return fields, info
 
     def _format_symbol(self, symbol: str) -> str:
         """Format symbol for yfinance.
@@ -91,8 +155,7 @@ class YFinanceProvider(DataProvider):
             return cached
 
         try:
-            ticker = yf.Ticker(formatted_symbol)
-            info = ticker.info
+            info = await self._call_upstream(self._load_info, formatted_symbol)
 
             if not info:
                 return None
@@ -148,7 +211,8 @@ class YFinanceProvider(DataProvider):
                 start_date = max(start_date, datetime.now() - timedelta(days=59))
 
             # Fetch data
-            df = ticker.history(
+            df = await self._call_upstream(
+                ticker.history,
                 start=start_date,
                 end=end_date,
                 interval=interval,
@@ -189,17 +253,14 @@ class YFinanceProvider(DataProvider):
             return cached
 
         try:
-            ticker = yf.Ticker(formatted_symbol)
-
             # Get fast info for real-time data
-            fast_info = ticker.fast_info
-            info = ticker.info
-
-            if not fast_info:
+            loaded = await self._call_upstream(self._load_quote_fields, formatted_symbol)
+            if loaded is None:
                 return None
+            fast_info, info = loaded
 
-            current_price = fast_info.last_price or info.get("currentPrice")
-            prev_close = fast_info.previous_close or info.get("previousClose")
+            current_price = fast_info["last_price"] or info.get("currentPrice")
+            prev_close = fast_info["previous_close"] or info.get("previousClose")
 
             if current_price is None or prev_close is None:
                 return None
@@ -213,14 +274,14 @@ class YFinanceProvider(DataProvider):
                 last_price=float(current_price),
                 change=float(change),
                 change_percent=float(change_percent),
-                day_high=float(fast_info.day_high or info.get("dayHigh", current_price)),
-                day_low=float(fast_info.day_low or info.get("dayLow", current_price)),
-                day_open=float(fast_info.open or info.get("openPrice", current_price)),
+                day_high=float(fast_info["day_high"] or info.get("dayHigh", current_price)),
+                day_low=float(fast_info["day_low"] or info.get("dayLow", current_price)),
+                day_open=float(fast_info["open"] or info.get("openPrice", current_price)),
                 prev_close=float(prev_close),
-                volume=int(fast_info.last_volume or info.get("volume", 0)),
+                volume=int(fast_info["last_volume"] or info.get("volume", 0)),
                 avg_volume=int(info.get("averageVolume", 0)),
-                fifty_two_week_high=float(fast_info.year_high or info.get("fiftyTwoWeekHigh", 0)),
-                fifty_two_week_low=float(fast_info.year_low or info.get("fiftyTwoWeekLow", 0)),
+                fifty_two_week_high=float(fast_info["year_high"] or info.get("fiftyTwoWeekHigh", 0)),
+                fifty_two_week_low=float(fast_info["year_low"] or info.get("fiftyTwoWeekLow", 0)),
                 timestamp=datetime.now(),
             )
 
@@ -335,8 +396,7 @@ class YFinanceProvider(DataProvider):
             FundamentalData object or None if not found
         """
         try:
-            ticker = yf.Ticker(formatted_symbol)
-            info = ticker.info
+            info = await self._call_upstream(self._load_info, formatted_symbol)
 
             if not info:
                 return None
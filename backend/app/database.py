@@ -1,20 +1,96 @@
 """Database configuration and session management."""
 
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import get_settings
 
 settings = get_settings()
 
+
+def _pool_options(database_url: str) -> dict[str, Any]:
+    """Get connection pool options for a database URL.
+
+    In-memory SQLite keeps the pool SQLAlchemy picks for it, since a sized
+    pool of private connections would each open an empty database.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Keyword arguments for create_async_engine
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and (not url.database or ":memory:" in url.database):
+        return {}
+
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+
+
+def _connect_args(database_url: str) -> dict[str, Any]:
+    """Get driver connect arguments for a database URL.
+
+    asyncpg keeps a per-connection prepared statement cache, so repeated
+    queries are parsed by the server once per connection.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Keyword arguments passed to the DBAPI connect call
+    """
+    if make_url(database_url).get_driver_name() == "asyncpg":
+        return {"statement_cache_size": 1024, "prepared_statement_cache_size": 1024}
+    return {}
+
+
+# Tests run against a shared-cache in-memory database to skip disk I/O
+database_url = settings.test_database_url if settings.testing else settings.database_url
+
+# Reject sync DBAPI drivers up front with a message that names the fix
+if not make_url(database_url).get_dialect().is_async:
+    raise ValueError(
+        "Database URL must use an async driver such as sqlite+aiosqlite or postgresql+asyncpg, "
+        f"got {make_url(database_url).render_as_string(hide_password=True)}"
+    )
+
 # Create async engine
 engine = create_async_engine(
-    settings.database_url,
+    database_url,
     echo=settings.debug,
     future=True,
+    query_cache_size=1200,
+    connect_args=_connect_args(database_url),
+    **_pool_options(database_url),
 )
 
-# Create async session factory
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL journaling and an in-memory temp store on each new SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+        cursor.close()
+
+
+# Create async session factory; objects stay loaded after commit so reading
+# their attributes does not trigger a lazy reload outside the session
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
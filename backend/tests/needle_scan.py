@@ -0,0 +1,33 @@
+"""Literal needle matching shared by the static verification scripts."""
+
+from typing import Iterable
+
+try:
+    import ahocorasick
+except ImportError:  # optional - NeedleSet falls back to one substring test per needle
+    ahocorasick = None
+
+
+class NeedleSet:
+    """Report which of a fixed set of literal needles occur in a text.
+
+    Uses a pyahocorasick automaton when installed. Otherwise each needle is
+    tested with `in`, which for a few dozen needles over a source file is
+    faster than any pure-Python single-pass matcher.
+    """
+
+    def __init__(self, needles: Iterable[str]):
+        self._needles = tuple(dict.fromkeys(needles))
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for needle in self._needles:
+                self._automaton.add_word(needle, needle)
+            self._automaton.make_automaton()
+        else:
+            self._automaton = None
+
+    def scan(self, text: str) -> set[str]:
+        """Return the needles found in text."""
+        if self._automaton is not None:
+            return {needle for _, needle in self._automaton.iter(text)}
+        return {needle for needle in self._needles if needle in text}
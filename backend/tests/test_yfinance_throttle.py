@@ -0,0 +1,87 @@
+"""Tests for the shared upstream throttle in YFinanceProvider."""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.yfinance_provider import YFinanceProvider
+
+CALL_DURATION = 0.05  # seconds each fake upstream call blocks for
+
+
+class _FakeUpstream:
+    """Blocking stand-in for a yfinance call that records concurrency and start times."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.starts: list[float] = []
+
+    def __call__(self) -> None:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.starts.append(time.monotonic())
+        time.sleep(CALL_DURATION)
+        with self._lock:
+            self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def _reset_spacing(monkeypatch):
+    """Start every test without a previous upstream request to space from."""
+    monkeypatch.setattr(YFinanceProvider, "_last_request_at", 0.0)
+
+
+async def _call_from_providers(upstream: _FakeUpstream, providers: int, calls_each: int) -> None:
+    instances = [YFinanceProvider() for _ in range(providers)]
+    await asyncio.gather(
+        *(provider._call_upstream(upstream) for provider in instances for _ in range(calls_each))
+    )
+
+
+def test_concurrency_capped_across_instances():
+    upstream = _FakeUpstream()
+    asyncio.run(_call_from_providers(upstream, providers=5, calls_each=2))
+
+    assert len(upstream.starts) == 10
+    assert upstream.peak <= 2
+
+
+def test_request_starts_are_spaced():
+    upstream = _FakeUpstream()
+    asyncio.run(_call_from_providers(upstream, providers=3, calls_each=2))
+
+    starts = sorted(upstream.starts)
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    # Small allowance for clock granularity between the sleep and the recorded start
+    assert min(gaps) >= YFinanceProvider._min_request_interval - 0.005
+
+
+def test_default_executor_not_blocked_by_queued_calls(monkeypatch):
+    # More queued calls than the default executor has workers (at most 32)
+    monkeypatch.setattr(YFinanceProvider, "_min_request_interval", 0.01)
+    upstream = _FakeUpstream()
+
+    async def run() -> float:
+        loop = asyncio.get_running_loop()
+        queued = asyncio.gather(*(YFinanceProvider()._call_upstream(upstream) for _ in range(64)))
+        await asyncio.sleep(0)
+
+        started = time.monotonic()
+        await loop.run_in_executor(None, lambda: None)
+        waited = time.monotonic() - started
+
+        await queued
+        return waited
+
+    # The queued calls take ~1.6s to drain; unrelated blocking work must not wait behind them
+    assert asyncio.run(run()) < 0.2
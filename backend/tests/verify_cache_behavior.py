@@ -8,20 +8,40 @@ This script tests:
 5. Database cache model verification
 """
 
+import argparse
 import asyncio
+import contextlib
+import functools
+import io
 import sys
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import AsyncMock
 
 # Add backend to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from app.core.yfinance_provider import YFinanceProvider
 from app.models.fundamental import FundamentalDataCache, FundamentalData
 from app.database import init_db, close_db, get_db_session
 
 
+def _buffered_output(test):
+    """Collect a test's console output and write it to stdout in a single call."""
+    @functools.wraps(test)
+    async def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                return await test(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+
+@_buffered_output
 async def test_in_memory_caching():
     """Test in-memory caching behavior."""
     print("\n" + "="*60)
@@ -85,6 +105,7 @@ async def test_in_memory_caching():
     return True
 
 
+@_buffered_output
 async def test_refresh_behavior():
     """Test refresh endpoint behavior."""
     print("\n" + "="*60)
@@ -140,6 +161,7 @@ async def test_refresh_behavior():
     return True
 
 
+@_buffered_output
 async def test_cache_expiration():
     """Test cache expiration/TTL behavior."""
     print("\n" + "="*60)
@@ -151,8 +173,7 @@ async def test_cache_expiration():
 
     print(f"\n1. Cache TTL Configuration:")
     print(f"   Cache TTL: {provider._cache_ttl}s (5 minutes)")
-    print(f"   Note: Actual expiration test would take 5 minutes")
-    print(f"   Verifying cache mechanism instead...")
+    print(f"   Note: Expiry is simulated by advancing the provider clock")
 
     # Fetch data
     data1 = await provider.get_fundamentals(test_symbol)
@@ -169,18 +190,25 @@ async def test_cache_expiration():
         print(f"   Current time: {datetime.now()}")
         print(f"   Time elapsed: {(datetime.now() - timestamp).total_seconds():.1f}s")
 
-        # Simulate cache expiration by manually removing entry
+        # Simulate cache expiration by moving the provider clock past the TTL
         print(f"\n3. Simulating cache expiration...")
-        del provider._cache[cache_key]
-        print(f"   ✓ Cache entry removed")
+        provider._now = lambda: datetime.now() + timedelta(seconds=provider._cache_ttl + 1)
+        if provider._get_cached(cache_key) is None:
+            print(f"   ✓ Entry treated as expired after {provider._cache_ttl + 1}s")
+        else:
+            print(f"   ✗ Entry still served after TTL elapsed")
+            return False
 
-        # Fetch again - should hit source
-        start = time.time()
-        data2 = await provider.get_fundamentals(test_symbol)
-        time2 = time.time() - start
+        # Fetch again - should go back to source; the fetch is mocked to skip the round-trip
+        fetch = AsyncMock(return_value=data1)
+        provider._fetch_fundamentals = fetch
+        await provider.get_fundamentals(test_symbol)
 
-        print(f"   ✓ Refetched after cache clear: {time2:.3f}s")
-        print(f"   ✓ Cache mechanism works correctly")
+        if fetch.await_count == 1:
+            print(f"   ✓ Expired entry triggered a refetch")
+        else:
+            print(f"   ✗ Expected 1 refetch, got {fetch.await_count}")
+            return False
     else:
         print(f"\n2. ✗ Cache entry not found!")
         return False
@@ -189,6 +217,7 @@ async def test_cache_expiration():
     return True
 
 
+@_buffered_output
 async def test_database_cache_model():
     """Test database cache model."""
     print("\n" + "="*60)
@@ -236,6 +265,7 @@ async def test_database_cache_model():
         await close_db()
 
 
+@_buffered_output
 async def test_api_endpoint_equivalence():
     """Test that API endpoints work correctly."""
     print("\n" + "="*60)
@@ -276,41 +306,55 @@ async def test_api_endpoint_equivalence():
     return True
 
 
-async def main():
-    """Run all verification tests."""
+async def main(fail_fast: bool = False):
+    """Run all verification tests.
+
+    Args:
+        fail_fast: Stop at the first failing test instead of running them all
+    """
     print("\n" + "="*60)
     print("FUNDAMENTAL DATA CACHING VERIFICATION")
     print("="*60)
 
+    tests = {
+        "in_memory_caching": test_in_memory_caching,
+        "refresh_behavior": test_refresh_behavior,
+        "cache_expiration": test_cache_expiration,
+        "database_model": test_database_cache_model,
+        "api_endpoints": test_api_endpoint_equivalence,
+    }
     results = {}
 
     try:
-        # Run tests
-        results["in_memory_caching"] = await test_in_memory_caching()
-        results["refresh_behavior"] = await test_refresh_behavior()
-        results["cache_expiration"] = await test_cache_expiration()
-        results["database_model"] = await test_database_cache_model()
-        results["api_endpoints"] = await test_api_endpoint_equivalence()
+        # Run tests - with fail_fast the remaining network round-trips are skipped
+        for name, test in tests.items():
+            results[name] = await test()
+            if fail_fast and not results[name]:
+                break
 
         # Summary
         print("\n" + "="*60)
         print("VERIFICATION SUMMARY")
         print("="*60)
 
-        passed = sum(1 for v in results.values() if v)
-        total = len(results)
-
-        for test_name, result in results.items():
-            status = "✅ PASSED" if result else "✗ FAILED"
+        for test_name in tests:
+            if test_name not in results:
+                status = "- SKIPPED"
+            else:
+                status = "✅ PASSED" if results[test_name] else "✗ FAILED"
             print(f"{test_name:.<40} {status}")
 
+        passed = sum(1 for v in results.values() if v)
+        total = len(tests)
         print(f"\nTotal: {passed}/{total} tests passed")
 
-        if passed == total:
+        if all(results.values()) and len(results) == total:
             print("\n🎉 All verification tests passed!")
             return 0
         else:
-            print(f"\n⚠ {total - passed} test(s) failed")
+            print(f"\n⚠ {len(results) - passed} test(s) failed")
+            if len(results) < total:
+                print(f"  {total - len(results)} skipped after first failure (--fail-fast)")
             return 1
 
     except Exception as e:
@@ -320,6 +364,18 @@ async def main():
         return 1
 
 
+def _parse_args() -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Verify fundamental data caching against live data")
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="stop at the first failing test",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    args = _parse_args()
+    exit_code = asyncio.run(main(fail_fast=args.fail_fast))
     sys.exit(exit_code)
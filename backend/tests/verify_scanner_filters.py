@@ -10,18 +10,127 @@ This script tests the scanner service with various fundamental filter combinatio
 6. Check no stocks outside filter range appear
 """
 
-import ast
+import copy
+import functools
+import json
+import os
 import re
-from typing import Any, Dict, List, Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+# Make the shared helper importable both as a script and via python -m tests.<name>
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from needle_scan import NeedleSet
+
+# Fundamental filter fields shared by ScanFilter, ScanRequest and run_scan
+FUNDAMENTAL_FILTER_FIELDS = ('min_pe', 'max_pe', 'min_roe', 'max_debt_to_equity', 'min_growth')
+
+SCANFILTER_FIELDS = {
+    'min_pe': 'min_pe: Optional[float]',
+    'max_pe': 'max_pe: Optional[float]',
+    'min_roe': 'min_roe: Optional[float]',
+    'max_debt_to_equity': 'max_debt_to_equity: Optional[float]',
+    'min_growth': 'min_growth: Optional[float]',
+}
+
+SCANRESULT_FIELDS = {
+    'pe_ratio': 'pe_ratio: Optional[float]',
+    'roe': 'roe: Optional[float]',
+    'debt_to_equity': 'debt_to_equity: Optional[float]',
+    'eps_growth': 'eps_growth: Optional[float]',
+    'revenue_growth': 'revenue_growth: Optional[float]',
+}
+
+# Literal code fragments the _passes_filter checks look for
+PASSES_FILTER_TOKENS = (
+    'f.min_pe is not None',
+    'result.pe_ratio < f.min_pe',
+    'f.max_pe is not None',
+    'result.pe_ratio > f.max_pe',
+    'result.pe_ratio is None',
+    'f.min_roe is not None',
+    'result.roe < f.min_roe',
+    'result.roe is None',
+    'f.max_debt_to_equity is not None',
+    'result.debt_to_equity > f.max_debt_to_equity',
+    'result.debt_to_equity is None',
+)
+
+# Growth filter (EPS OR revenue) fragments by check; each starts with a literal,
+# which lets re skip ahead instead of trying every offset as an alternation would
+_GROWTH = {
+    'growth_guard': re.compile(r'f\.min_growth is not None'),
+    'growth_eps': re.compile(r'eps_growth\s*>=\s*f\.min_growth'),
+    'growth_revenue': re.compile(r'revenue_growth\s*>=\s*f\.min_growth'),
+    'growth_either': re.compile(r'eps_ok\s+or\s+revenue_ok'),
+}
+
+# Every token of interest, so each code block is scanned exactly once
+_TOKENS = NeedleSet([
+    *SCANFILTER_FIELDS,
+    *SCANRESULT_FIELDS,
+    *PASSES_FILTER_TOKENS,
+    *(f'{field}=request.{field}' for field in FUNDAMENTAL_FILTER_FIELDS),
+])
+
+# Code blocks as (start marker, end markers); a block runs to the first end marker or EOF
+_SCANFILTER_BLOCK = ('class ScanFilter', ('\nclass',))
+_SCANRESULT_BLOCK = ('class ScanResult', ('\nclass',))
+_PASSES_FILTER_BLOCK = ('def _passes_filter', ('\n    def ', '\nclass '))
+_SCANREQUEST_BLOCK = ('class ScanRequest', ('\n@', '\nclass '))
+_RUN_SCAN_BLOCK = ('async def run_scan', ('\n@',))
+
+# Backend directory that relative source paths are resolved against
+_BACKEND_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def _resolve(path: str) -> str:
+    """Return path unchanged if absolute, otherwise relative to the backend directory."""
+    return path if os.path.isabs(path) else os.path.join(_BACKEND_ROOT, path)
+
+
+def _file_key(path: str) -> Tuple[str, int, int]:
+    """Identify the current on-disk version of a file by path, mtime and size."""
+    st = os.stat(path)
+    return path, st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=None)
+def _read(path: str, mtime_ns: int, size: int) -> str:
+    """Read one version of a source file; the version fields only key the cache."""
+    with open(path, 'r') as f:
+        return f.read()
+
+
+def _load(path: str) -> str:
+    """Read a source file, once per on-disk version."""
+    return _read(*_file_key(path))
+
+
+def _slice_block(content: str, start_marker: str, end_markers: tuple) -> Optional[str]:
+    """Return the text from start_marker up to the nearest end marker, or None if absent.
+
+    Plain str.find calls replace a lazy DOTALL regex with a lookahead, which
+    had to retry the lookahead at every character of the block.
+    """
+    start = content.find(start_marker)
+    if start < 0:
+        return None
+
+    end = len(content)
+    search_from = start + len(start_marker)
+    for marker in end_markers:
+        pos = content.find(marker, search_from)
+        if 0 <= pos < end:
+            end = pos
+    return content[start:end]
 
 
 def extract_filter_logic(filepath: str) -> Dict[str, Any]:
     """Extract the _passes_filter method logic from scanner.py."""
-    with open(filepath, 'r') as f:
-        content = f.read()
-
-    # Parse the file
-    tree = ast.parse(content)
+    content = _load(filepath)
 
     # Find the _passes_filter method
     filter_logic = {
@@ -32,300 +141,204 @@ def extract_filter_logic(filepath: str) -> Dict[str, Any]:
         'min_growth': None,
     }
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) and node.name == '_passes_filter':
-            # Found the method, extract filter logic
-            filter_logic['method_found'] = True
-            filter_logic['has_fundamental_filters'] = False
-
-            # Check for fundamental filter checks
-            fundamental_checks = [
-                'min_pe', 'max_pe', 'min_roe', 'max_debt_to_equity', 'min_growth'
-            ]
+    # Every check below is a substring test, so a literal lookup replaces parsing
+    if 'def _passes_filter' in content:
+        # Found the method, extract filter logic
+        filter_logic['method_found'] = True
+        filter_logic['has_fundamental_filters'] = False
 
-            for check in fundamental_checks:
-                if f'f.{check}' in content or f'result.{check.replace("max_", "").replace("min_", "")}' in content:
-                    filter_logic[check] = True
-                    filter_logic['has_fundamental_filters'] = True
+        # Check for fundamental filter checks
+        for check in FUNDAMENTAL_FILTER_FIELDS:
+            if f'f.{check}' in content or f'result.{check.replace("max_", "").replace("min_", "")}' in content:
+                filter_logic[check] = True
+                filter_logic['has_fundamental_filters'] = True
 
     return filter_logic
 
 
+def _to_verifications(rows: List[Tuple[str, bool]]) -> List[Dict[str, Any]]:
+    """Expand (check, actual) rows into verification records."""
+    return [
+        {'check': check, 'expected': True, 'actual': actual, 'status': 'PASS' if actual else 'FAIL'}
+        for check, actual in rows
+    ]
+
+
+# Verification records keyed by (check name, path, mtime_ns, size)
+_verify_cache: Dict[Tuple[str, str, int, int], List[Dict[str, Any]]] = {}
+
+
+def _verify_cached(check, filepath: str) -> List[Dict[str, Any]]:
+    """Run a content check on a file, reusing the result until the file changes."""
+    key = (check.__name__, *_file_key(filepath))
+    if key not in _verify_cache:
+        _verify_cache[key] = _to_verifications(check(_load(filepath)))
+    return list(_verify_cache[key])
+
+
+def invalidate() -> None:
+    """Drop all cached file contents and verification results."""
+    _verify_cache.clear()
+    _read.cache_clear()
+
+
 def verify_filter_implementation(filepath: str) -> List[Dict[str, Any]]:
     """Verify the filter implementation details."""
-    # Handle both relative and absolute paths
-    import os
-    if not os.path.isabs(filepath):
-        filepath = os.path.join(os.path.dirname(__file__), '..', filepath)
+    return _verify_cached(_check_filter_implementation, _resolve(filepath))
 
-    with open(filepath, 'r') as f:
-        content = f.read()
 
-    verifications = []
+def _check_filter_implementation(content: str) -> List[Tuple[str, bool]]:
+    """Return (check, actual) rows for the scanner service source."""
+    rows: List[Tuple[str, bool]] = []
 
     # 1. Verify ScanFilter has fundamental fields
-    scanfilter_match = re.search(
-        r'class ScanFilter.*?(?=\nclass|\Z)',
-        content,
-        re.DOTALL
-    )
-
-    if scanfilter_match:
-        scanfilter_code = scanfilter_match.group(0)
-        fundamental_fields = {
-            'min_pe': 'min_pe: Optional[float]',
-            'max_pe': 'max_pe: Optional[float]',
-            'min_roe': 'min_roe: Optional[float]',
-            'max_debt_to_equity': 'max_debt_to_equity: Optional[float]',
-            'min_growth': 'min_growth: Optional[float]',
-        }
-
-        for field, signature in fundamental_fields.items():
-            found = field in scanfilter_code
-            verifications.append({
-                'check': f'ScanFilter has {field} field',
-                'expected': True,
-                'actual': found,
-                'status': 'PASS' if found else 'FAIL'
-            })
+    scanfilter_code = _slice_block(content, *_SCANFILTER_BLOCK)
+
+    if scanfilter_code is not None:
+        found_tokens = _TOKENS.scan(scanfilter_code)
+        rows.extend((f'ScanFilter has {field} field', field in found_tokens) for field in SCANFILTER_FIELDS)
 
     # 2. Verify ScanResult has fundamental fields
-    scanresult_match = re.search(
-        r'class ScanResult.*?(?=\nclass|\Z)',
-        content,
-        re.DOTALL
-    )
-
-    if scanresult_match:
-        scanresult_code = scanresult_match.group(0)
-        fundamental_fields = {
-            'pe_ratio': 'pe_ratio: Optional[float]',
-            'roe': 'roe: Optional[float]',
-            'debt_to_equity': 'debt_to_equity: Optional[float]',
-            'eps_growth': 'eps_growth: Optional[float]',
-            'revenue_growth': 'revenue_growth: Optional[float]',
-        }
-
-        for field, signature in fundamental_fields.items():
-            found = field in scanresult_code
-            verifications.append({
-                'check': f'ScanResult has {field} field',
-                'expected': True,
-                'actual': found,
-                'status': 'PASS' if found else 'FAIL'
-            })
+    scanresult_code = _slice_block(content, *_SCANRESULT_BLOCK)
+
+    if scanresult_code is not None:
+        found_tokens = _TOKENS.scan(scanresult_code)
+        rows.extend((f'ScanResult has {field} field', field in found_tokens) for field in SCANRESULT_FIELDS)
 
     # 3. Verify _passes_filter implements fundamental filtering logic
-    passes_filter_match = re.search(
-        r'def _passes_filter.*?(?=\n    def |\nclass |\Z)',
-        content,
-        re.DOTALL
-    )
-
-    if passes_filter_match:
-        filter_code = passes_filter_match.group(0)
-
-        # Check P/E filter logic
-        pe_filter_checks = [
-            ('P/E min filter', 'f.min_pe is not None' in filter_code and 'result.pe_ratio < f.min_pe' in filter_code),
-            ('P/E max filter', 'f.max_pe is not None' in filter_code and 'result.pe_ratio > f.max_pe' in filter_code),
-            ('P/E None handling', 'result.pe_ratio is None' in filter_code),
-        ]
-
-        for check_name, condition in pe_filter_checks:
-            verifications.append({
-                'check': f'P/E filter: {check_name}',
-                'expected': True,
-                'actual': condition,
-                'status': 'PASS' if condition else 'FAIL'
-            })
-
-        # Check ROE filter logic
-        roe_filter_checks = [
-            ('ROE min filter', 'f.min_roe is not None' in filter_code and 'result.roe < f.min_roe' in filter_code),
-            ('ROE None handling', 'result.roe is None' in filter_code),
-        ]
-
-        for check_name, condition in roe_filter_checks:
-            verifications.append({
-                'check': f'ROE filter: {check_name}',
-                'expected': True,
-                'actual': condition,
-                'status': 'PASS' if condition else 'FAIL'
-            })
-
-        # Check D/E filter logic
-        debt_filter_checks = [
-            ('D/E max filter', 'f.max_debt_to_equity is not None' in filter_code and 'result.debt_to_equity > f.max_debt_to_equity' in filter_code),
-            ('D/E None handling', 'result.debt_to_equity is None' in filter_code),
-        ]
-
-        for check_name, condition in debt_filter_checks:
-            verifications.append({
-                'check': f'Debt/Equity filter: {check_name}',
-                'expected': True,
-                'actual': condition,
-                'status': 'PASS' if condition else 'FAIL'
-            })
-
-        # Check Growth filter logic (EPS OR revenue)
-        growth_filter_checks = [
-            ('Growth min filter', 'f.min_growth is not None' in filter_code),
-            ('EPS growth check', 'eps_growth' in filter_code and 'eps_growth >= f.min_growth' in filter_code),
-            ('Revenue growth check', 'revenue_growth' in filter_code and 'revenue_growth >= f.min_growth' in filter_code),
-            ('OR logic for growth', 'eps_ok or revenue_ok' in filter_code or 'eps_ok or revenue_ok' in filter_code),
-        ]
-
-        for check_name, condition in growth_filter_checks:
-            verifications.append({
-                'check': f'Growth filter: {check_name}',
-                'expected': True,
-                'actual': condition,
-                'status': 'PASS' if condition else 'FAIL'
-            })
-
-    return verifications
+    passes_filter_code = _slice_block(content, *_PASSES_FILTER_BLOCK)
+
+    if passes_filter_code is not None:
+        found_tokens = _TOKENS.scan(passes_filter_code)
+        found_tokens.update(check for check, pattern in _GROWTH.items() if pattern.search(passes_filter_code))
+
+        rows.extend([
+            # P/E filter logic
+            ('P/E filter: P/E min filter', 'f.min_pe is not None' in found_tokens and 'result.pe_ratio < f.min_pe' in found_tokens),
+            ('P/E filter: P/E max filter', 'f.max_pe is not None' in found_tokens and 'result.pe_ratio > f.max_pe' in found_tokens),
+            ('P/E filter: P/E None handling', 'result.pe_ratio is None' in found_tokens),
+            # ROE filter logic
+            ('ROE filter: ROE min filter', 'f.min_roe is not None' in found_tokens and 'result.roe < f.min_roe' in found_tokens),
+            ('ROE filter: ROE None handling', 'result.roe is None' in found_tokens),
+            # D/E filter logic
+            ('Debt/Equity filter: D/E max filter', 'f.max_debt_to_equity is not None' in found_tokens and 'result.debt_to_equity > f.max_debt_to_equity' in found_tokens),
+            ('Debt/Equity filter: D/E None handling', 'result.debt_to_equity is None' in found_tokens),
+            # Growth filter logic (EPS OR revenue)
+            ('Growth filter: Growth min filter', 'growth_guard' in found_tokens),
+            ('Growth filter: EPS growth check', 'growth_eps' in found_tokens),
+            ('Growth filter: Revenue growth check', 'growth_revenue' in found_tokens),
+            ('Growth filter: OR logic for growth', 'growth_either' in found_tokens),
+        ])
+
+    return rows
 
 
 def verify_api_route(filepath: str) -> List[Dict[str, Any]]:
     """Verify the API route supports fundamental filters."""
-    # Handle both relative and absolute paths
-    import os
-    if not os.path.isabs(filepath):
-        filepath = os.path.join(os.path.dirname(__file__), '..', filepath)
+    return _verify_cached(_check_api_route, _resolve(filepath))
 
-    with open(filepath, 'r') as f:
-        content = f.read()
 
-    verifications = []
+def _check_api_route(content: str) -> List[Tuple[str, bool]]:
+    """Return (check, actual) rows for the scanner API route source."""
+    rows: List[Tuple[str, bool]] = []
 
     # Check ScanRequest model
-    scanrequest_match = re.search(
-        r'class ScanRequest.*?(?=\n@|\nclass |\Z)',
-        content,
-        re.DOTALL
-    )
-
-    if scanrequest_match:
-        scanrequest_code = scanrequest_match.group(0)
-        fundamental_fields = {
-            'min_pe': 'min_pe',
-            'max_pe': 'max_pe',
-            'min_roe': 'min_roe',
-            'max_debt_to_equity': 'max_debt_to_equity',
-            'min_growth': 'min_growth',
-        }
-
-        for field, name in fundamental_fields.items():
-            found = field in scanrequest_code
-            verifications.append({
-                'check': f'ScanRequest has {field} field',
-                'expected': True,
-                'actual': found,
-                'status': 'PASS' if found else 'FAIL'
-            })
-
-    # Check if filters are passed to ScanFilter
-    run_scan_match = re.search(
-        r'async def run_scan.*?(?=\n@|\Z)',
-        content,
-        re.DOTALL
-    )
-
-    if run_scan_match:
-        run_scan_code = run_scan_match.group(0)
-
-        # Check that fundamental filters are passed from request to ScanFilter
-        fundamental_passing = [
-            'min_pe=request.min_pe' in run_scan_code,
-            'max_pe=request.max_pe' in run_scan_code,
-            'min_roe=request.min_roe' in run_scan_code,
-            'max_debt_to_equity=request.max_debt_to_equity' in run_scan_code,
-            'min_growth=request.min_growth' in run_scan_code,
-        ]
-
-        for i, condition in enumerate(fundamental_passing):
-            field = ['min_pe', 'max_pe', 'min_roe', 'max_debt_to_equity', 'min_growth'][i]
-            verifications.append({
-                'check': f'run_scan passes {field} to ScanFilter',
-                'expected': True,
-                'actual': condition,
-                'status': 'PASS' if condition else 'FAIL'
-            })
-
-    return verifications
+    scanrequest_code = _slice_block(content, *_SCANREQUEST_BLOCK)
 
+    if scanrequest_code is not None:
+        found_tokens = _TOKENS.scan(scanrequest_code)
+        rows.extend((f'ScanRequest has {field} field', field in found_tokens) for field in FUNDAMENTAL_FILTER_FIELDS)
 
-def create_test_cases() -> List[Dict[str, Any]]:
-    """Create test case definitions for scanner filters."""
-    test_cases = [
-        {
-            'name': 'Test 1: Low P/E Filter (<20)',
-            'description': 'Run scanner with P/E ratio filter to find undervalued stocks',
-            'filter': {
-                'max_pe': 20.0,
-                'min_composite_score': 50.0,
-            },
-            'expected_behavior': 'Only stocks with P/E < 20 should appear in results',
-            'verification': 'All results should have pe_ratio < 20 or pe_ratio is None (handled gracefully)',
+    # Check if filters are passed to ScanFilter
+    run_scan_code = _slice_block(content, *_RUN_SCAN_BLOCK)
+
+    if run_scan_code is not None:
+        found_tokens = _TOKENS.scan(run_scan_code)
+        rows.extend(
+            (f'run_scan passes {field} to ScanFilter', f'{field}=request.{field}' in found_tokens)
+            for field in FUNDAMENTAL_FILTER_FIELDS
+        )
+
+    return rows
+
+
+# Scanner filter scenarios, built once at import; treat as read-only and use
+# create_test_cases() for copies that are safe to modify
+TEST_CASES: Tuple[Dict[str, Any], ...] = (
+    {
+        'name': 'Test 1: Low P/E Filter (<20)',
+        'description': 'Run scanner with P/E ratio filter to find undervalued stocks',
+        'filter': {
+            'max_pe': 20.0,
+            'min_composite_score': 50.0,
         },
-        {
-            'name': 'Test 2: High ROE Filter (>20%)',
-            'description': 'Run scanner with ROE filter to find profitable companies',
-            'filter': {
-                'min_roe': 20.0,
-                'min_composite_score': 50.0,
-            },
-            'expected_behavior': 'Only stocks with ROE > 20% should appear in results',
-            'verification': 'All results should have roe > 20',
+        'expected_behavior': 'Only stocks with P/E < 20 should appear in results',
+        'verification': 'All results should have pe_ratio < 20 or pe_ratio is None (handled gracefully)',
+    },
+    {
+        'name': 'Test 2: High ROE Filter (>20%)',
+        'description': 'Run scanner with ROE filter to find profitable companies',
+        'filter': {
+            'min_roe': 20.0,
+            'min_composite_score': 50.0,
         },
-        {
-            'name': 'Test 3: Low Debt Filter (D/E < 30%)',
-            'description': 'Run scanner with debt-to-equity filter to find low-debt companies',
-            'filter': {
-                'max_debt_to_equity': 30.0,
-                'min_composite_score': 50.0,
-            },
-            'expected_behavior': 'Only stocks with D/E < 30% should appear in results',
-            'verification': 'All results should have debt_to_equity < 30 or debt_to_equity is None',
+        'expected_behavior': 'Only stocks with ROE > 20% should appear in results',
+        'verification': 'All results should have roe > 20',
+    },
+    {
+        'name': 'Test 3: Low Debt Filter (D/E < 30%)',
+        'description': 'Run scanner with debt-to-equity filter to find low-debt companies',
+        'filter': {
+            'max_debt_to_equity': 30.0,
+            'min_composite_score': 50.0,
         },
-        {
-            'name': 'Test 4: Combined Fundamental Filters',
-            'description': 'Run scanner with multiple fundamental filters combined',
-            'filter': {
-                'max_pe': 25.0,
-                'min_roe': 15.0,
-                'max_debt_to_equity': 50.0,
-                'min_growth': 10.0,
-                'min_composite_score': 60.0,
-            },
-            'expected_behavior': 'Only stocks meeting ALL fundamental criteria should appear',
-            'verification': 'All results should pass all filter conditions',
+        'expected_behavior': 'Only stocks with D/E < 30% should appear in results',
+        'verification': 'All results should have debt_to_equity < 30 or debt_to_equity is None',
+    },
+    {
+        'name': 'Test 4: Combined Fundamental Filters',
+        'description': 'Run scanner with multiple fundamental filters combined',
+        'filter': {
+            'max_pe': 25.0,
+            'min_roe': 15.0,
+            'max_debt_to_equity': 50.0,
+            'min_growth': 10.0,
+            'min_composite_score': 60.0,
         },
-        {
-            'name': 'Test 5: Growth Filter (EPS or Revenue)',
-            'description': 'Run scanner with growth filter - checks EPS OR revenue',
-            'filter': {
-                'min_growth': 15.0,
-                'min_composite_score': 50.0,
-            },
-            'expected_behavior': 'Stocks with EPS growth >= 15% OR revenue growth >= 15% should appear',
-            'verification': 'Each result should have eps_growth >= 15 OR revenue_growth >= 15',
+        'expected_behavior': 'Only stocks meeting ALL fundamental criteria should appear',
+        'verification': 'All results should pass all filter conditions',
+    },
+    {
+        'name': 'Test 5: Growth Filter (EPS or Revenue)',
+        'description': 'Run scanner with growth filter - checks EPS OR revenue',
+        'filter': {
+            'min_growth': 15.0,
+            'min_composite_score': 50.0,
         },
-        {
-            'name': 'Test 6: P/E Range Filter',
-            'description': 'Run scanner with both min and max P/E for value investing',
-            'filter': {
-                'min_pe': 10.0,
-                'max_pe': 25.0,
-                'min_composite_score': 50.0,
-            },
-            'expected_behavior': 'Only stocks with 10 <= P/E <= 25 should appear',
-            'verification': 'All results should have 10 <= pe_ratio <= 25',
+        'expected_behavior': 'Stocks with EPS growth >= 15% OR revenue growth >= 15% should appear',
+        'verification': 'Each result should have eps_growth >= 15 OR revenue_growth >= 15',
+    },
+    {
+        'name': 'Test 6: P/E Range Filter',
+        'description': 'Run scanner with both min and max P/E for value investing',
+        'filter': {
+            'min_pe': 10.0,
+            'max_pe': 25.0,
+            'min_composite_score': 50.0,
         },
-    ]
+        'expected_behavior': 'Only stocks with 10 <= P/E <= 25 should appear',
+        'verification': 'All results should have 10 <= pe_ratio <= 25',
+    },
+)
 
-    return test_cases
+# JSON request bodies for the example curl commands, one per test case
+_CURL_BODIES = tuple(json.dumps(test['filter']) for test in TEST_CASES)
+
+
+def create_test_cases() -> List[Dict[str, Any]]:
+    """Return the test case definitions for scanner filters."""
+    # Deep copies, so callers editing a case cannot change TEST_CASES or _CURL_BODIES
+    return copy.deepcopy(list(TEST_CASES))
 
 
 def print_section(title: str):
@@ -352,14 +365,19 @@ def main():
     """Main verification function."""
     print_section("SCANNER FUNDAMENTAL FILTERS VERIFICATION")
 
+    # The two verifiers read different files and share no state, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        scanner_future = executor.submit(verify_filter_implementation, 'app/services/scanner.py')
+        api_future = executor.submit(verify_api_route, 'app/api/routes/scanner.py')
+        scanner_results = scanner_future.result()
+        api_results = api_future.result()
+
     # Test 1: Verify scanner service implementation
     print("\n[1] Verifying Scanner Service Implementation (backend/app/services/scanner.py)")
-    scanner_results = verify_filter_implementation('app/services/scanner.py')
     scanner_ok = print_verification_results(scanner_results)
 
     # Test 2: Verify API route implementation
     print("\n[2] Verifying API Route Implementation (backend/app/api/routes/scanner.py)")
-    api_results = verify_api_route('app/api/routes/scanner.py')
     api_ok = print_verification_results(api_results)
 
     # Test 3: Display test case definitions
@@ -433,12 +451,11 @@ def main():
         print("  1. Start the backend: cd backend && uvicorn app.main:app --reload")
         print("  2. Run test requests: See below for example curl commands")
         print("\nExample runtime test commands:")
-        for test in test_cases:
+        for test, payload in zip(test_cases, _CURL_BODIES):
             print(f"\n# {test['name']}")
             print(f'curl -X POST http://localhost:8000/api/scanner/run \\')
             print(f'  -H "Content-Type: application/json" \\')
-            import json
-            print(f'  -d \'{json.dumps(test["filter"])}\'')
+            print(f'  -d \'{payload}\'')
         return 0
     else:
         print("\n✗ Some checks failed. Please review the implementation.")